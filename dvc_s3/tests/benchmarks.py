@@ -1,4 +1,39 @@
 # pylint: disable=unused-import
+import pytest
+
 from dvc.testing.benchmarks.cli.stories.use_cases.test_sharing import (
     test_sharing as test_sharing_s3,  # noqa: F401
 )
+from dvc_s3 import S3FileSystem
+
+
+@pytest.mark.parametrize(
+    "jobs, max_pool_connections",
+    [
+        (4, None),
+        (16, None),
+        (64, None),
+        # starved baseline: same concurrency, pool capped at botocore's default
+        (64, 10),
+    ],
+)
+def test_put_jobs_scaling(benchmark, tmp_path, s3, jobs, max_pool_connections):
+    """Upload throughput with the pool sized from `jobs` vs a fixed pool.
+
+    Comparing `(64, None)` with `(64, 10)` isolates the effect of the pool
+    size, since both run with the same `batch_size`. Against the local moto
+    server these small objects mostly measure moto itself, run against
+    real S3 (`DVC_TEST_AWS_REPO_BUCKET`) for meaningful numbers.
+    """
+    for i in range(256):
+        (tmp_path / f"{i}.bin").write_bytes(i.to_bytes(2, "big") * 4096)
+
+    config = {**s3.config, "jobs": jobs}
+    if max_pool_connections is not None:
+        config["max_pool_connections"] = max_pool_connections
+    fs = S3FileSystem(**config)
+    name = f"{jobs}-{max_pool_connections or 'auto'}"
+    lpaths = [str(tmp_path / f"{i}.bin") for i in range(256)]
+    rpaths = [f"{s3.fs_path}/{name}/{i}.bin" for i in range(256)]
+
+    benchmark(fs.put, lpaths, rpaths, batch_size=jobs)
@@ -0,0 +1,92 @@
+import hashlib
+import sys
+
+import pytest
+
+from dvc_s3 import S3FileSystem
+from dvc_s3.index import ITEM_SIZE, NUM_BUCKETS, HashIndex
+
+
+def _md5(i: int) -> str:
+    return hashlib.md5(str(i).encode()).hexdigest()
+
+
+def _path(hash_: str, prefix: str = "bucket/files/md5") -> str:
+    return f"{prefix}/{hash_[:2]}/{hash_[2:]}"
+
+
+def test_add_path():
+    index = HashIndex()
+    hash_ = _md5(0)
+
+    assert index.add_path(_path(hash_))
+    assert index.add_path(_path(f"{_md5(1)}.dir"))
+    assert index.add_path(_path(_md5(2), prefix="bucket"))
+    assert not index.add_path("bucket/files/md5/00/tmp")
+    assert not index.add_path("bucket/.dvc/config")
+
+    assert hash_ in index
+    assert f"{_md5(1)}.dir" in index
+    assert _md5(1) not in index
+    assert _md5(2) in index
+    assert _md5(3) not in index
+    assert "not-a-hash" not in index
+    assert hash_.upper() not in index
+    assert index.difference([hash_.upper()]) == {hash_.upper()}
+    assert set(index) == {hash_, f"{_md5(1)}.dir", _md5(2)}
+
+
+def test_incremental_updates():
+    index = HashIndex(_path(_md5(i)) for i in range(100))
+    assert _md5(50) in index
+    assert _md5(150) not in index
+
+    index.update(_path(_md5(i)) for i in range(50, 200))
+    assert _md5(150) in index
+    assert len(index) == 200
+
+
+def _allocated(index: HashIndex) -> int:
+    return sum(sys.getsizeof(buf) for buf in index._buckets)
+
+
+@pytest.mark.parametrize("count", [1000, 100000])
+def test_memory_per_key(count):
+    # each bucket is a bytearray with ~57 bytes of object overhead
+    overhead = NUM_BUCKETS * sys.getsizeof(bytearray(1))
+    index = HashIndex(_path(_md5(i)) for i in range(count))
+
+    # appending may overallocate by up to ~1/8
+    assert _allocated(index) <= count * ITEM_SIZE * 9 / 8 + overhead
+
+    index.compact()
+    assert len(index) == count
+    assert _allocated(index) <= count * ITEM_SIZE + overhead
+    if count >= 100000:
+        assert _allocated(index) / count < ITEM_SIZE + 0.5
+
+
+def test_difference():
+    index = HashIndex(_path(_md5(i)) for i in range(0, 1000, 2))
+    index.add_path(_path(f"{_md5(0)}.dir"))
+
+    local = {_md5(i) for i in range(1000)} | {f"{_md5(0)}.dir", f"{_md5(1)}.dir"}
+
+    assert index.difference(local) == {_md5(i) for i in range(1, 1000, 2)} | {
+        f"{_md5(1)}.dir"
+    }
+    assert index.intersection(local) == {_md5(i) for i in range(0, 1000, 2)} | {
+        f"{_md5(0)}.dir"
+    }
+
+
+def test_hash_index(s3):
+    hashes = [_md5(i) for i in range(20)]
+    for hash_ in hashes:
+        (s3 / "files" / "md5" / hash_[:2] / hash_[2:]).write_bytes(b"data")
+    (s3 / "files" / "md5" / "00" / "tmp").write_bytes(b"data")
+    (s3 / "other").write_bytes(b"data")
+
+    fs = S3FileSystem(**s3.config)
+    index = fs.hash_index(f"{s3.fs_path}/files/md5", batch_size=4)
+    assert set(index) == set(hashes)
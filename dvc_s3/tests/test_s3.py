@@ -136,3 +136,105 @@ def test_key_id_and_secret():
     assert fs.fs_args["key"] == key_id
     assert fs.fs_args["secret"] == key_secret
     assert fs.fs_args["token"] == session_token
+
+
+def test_max_pool_connections_from_jobs():
+    fs = S3FileSystem(url=url, jobs=64)
+    assert fs.fs_args["config_kwargs"]["max_pool_connections"] == 64
+
+    fs = S3FileSystem(url=url, jobs=1)
+    assert fs.fs_args["config_kwargs"]["max_pool_connections"] == 10
+
+    fs = S3FileSystem(url=url, jobs=64, max_pool_connections=128)
+    assert fs.fs_args["config_kwargs"]["max_pool_connections"] == 128
+
+
+def test_connection_options():
+    fs = S3FileSystem(
+        url=url,
+        retry_mode="adaptive",
+        max_attempts=5,
+        keepalive_timeout=30,
+        force_close=False,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+    )
+    config_kwargs = fs.fs_args["config_kwargs"]
+    assert config_kwargs["retries"] == {"mode": "adaptive", "total_max_attempts": 5}
+    assert config_kwargs["connector_args"] == {
+        "keepalive_timeout": 30.0,
+        "force_close": False,
+        "use_dns_cache": True,
+        "ttl_dns_cache": 300,
+    }
+
+
+def test_connection_options_from_strings():
+    fs = S3FileSystem(
+        url=url,
+        max_pool_connections="32",
+        max_attempts="3",
+        keepalive_timeout="15.5",
+        force_close="false",
+        use_dns_cache="False",
+        ttl_dns_cache="60",
+    )
+    config_kwargs = fs.fs_args["config_kwargs"]
+    assert config_kwargs["max_pool_connections"] == 32
+    assert config_kwargs["retries"] == {"total_max_attempts": 3}
+    assert config_kwargs["connector_args"] == {
+        "keepalive_timeout": 15.5,
+        "force_close": False,
+        "use_dns_cache": False,
+        "ttl_dns_cache": 60,
+    }
+
+
+@pytest.mark.parametrize(
+    "option, value",
+    [
+        ("force_close", "maybe"),
+        ("use_dns_cache", "2"),
+        ("max_pool_connections", "many"),
+        ("max_attempts", "3.5"),
+        ("keepalive_timeout", "long"),
+        ("ttl_dns_cache", "forever"),
+    ],
+)
+def test_connection_options_invalid(option, value):
+    fs = S3FileSystem(url=url, **{option: value})
+    with pytest.raises(ConfigError, match=f"`{option}`"):
+        fs.fs_args  # noqa: B018
+
+
+def test_force_close_keepalive_timeout_mutually_exclusive():
+    fs = S3FileSystem(url=url, force_close=True, keepalive_timeout=30)
+    with pytest.raises(ConfigError, match="mutually exclusive"):
+        fs.fs_args  # noqa: B018
+
+
+def test_force_close_connector():
+    import asyncio
+
+    from aiobotocore.config import AioConfig
+    from aiohttp import TCPConnector
+
+    fs = S3FileSystem(url=url, force_close="true")
+    config = AioConfig(**fs.fs_args["config_kwargs"])
+    assert config.connector_args == {"force_close": True, "keepalive_timeout": None}
+
+    async def _connect():
+        # the same way aiobotocore's AIOHTTPSession builds its connector
+        connector = TCPConnector(
+            limit=config.max_pool_connections, **config.connector_args
+        )
+        await connector.close()
+
+    asyncio.run(_connect())
+
+
+def test_connection_options_default():
+    fs = S3FileSystem(url=url)
+    config_kwargs = fs.fs_args["config_kwargs"]
+    assert "retries" not in config_kwargs
+    assert "connector_args" not in config_kwargs
@@ -1,6 +1,6 @@
 import pytest
 
-from dvc_s3 import human_readable_to_bytes
+from dvc_s3 import human_readable_to_bytes, to_bool
 
 KB = 1024
 MB = KB**2
@@ -28,3 +28,26 @@ def test_conversions_human_readable_to_bytes(test_input, expected):
 def test_conversions_human_readable_to_bytes_invalid(invalid_input):
     with pytest.raises(ValueError):  # noqa: PT011
         human_readable_to_bytes(invalid_input)
+
+
+@pytest.mark.parametrize(
+    "test_input, expected",
+    [
+        (True, True),
+        (False, False),
+        ("true", True),
+        ("False", False),
+        ("yes", True),
+        ("off", False),
+        ("1", True),
+        (0, False),
+    ],
+)
+def test_to_bool(test_input, expected):
+    assert to_bool(test_input) is expected
+
+
+@pytest.mark.parametrize("invalid_input", ["foo", "", "2"])
+def test_to_bool_invalid(invalid_input):
+    with pytest.raises(ValueError):  # noqa: PT011
+        to_bool(invalid_input)